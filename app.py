@@ -5,9 +5,10 @@ Flask web app for Weather Prediction (Rain Tomorrow) with a simplified UI.
 
 Overview
 --------
-This application serves a trained XGBoost model behind a minimal, end-user
-interface. Users provide a small set of inputs (Location, Date, MinTemp,
-MaxTemp, Humidity3pm, WindSpeed3pm, optional Rainfall), and the app
+This application serves a trained XGBoost model (exported to ONNX and run with
+ONNX Runtime) behind a minimal, end-user interface. Users provide a small set
+of inputs (Location, Date, MinTemp, MaxTemp, Humidity3pm, WindSpeed3pm,
+optional Rainfall), and the app
 deterministically infers the remaining model features using season-aware
 heuristics before making a prediction.
 
@@ -15,13 +16,17 @@ Design
 ------
 - Minimal inputs for normal users: Location, Date, MinTemp, MaxTemp,
   Humidity3pm, WindSpeed3pm, (optional) Rainfall today.
-- Everything else (sunshine, cloud, pressure, wind directions, 9am features,
-  Temp3pm, gusts, RainToday boolean) is inferred from the posted inputs.
+- Everything else (sunshine, cloud, pressure, evaporation, wind direction,
+  RainToday boolean) is inferred from the posted inputs.
+- ``POST /predict_batch`` accepts a JSON list of the same inputs and scores
+  them with one vectorised model call.
 
 Notes
 -----
-- Category encodings (e.g., wind directions, locations, Yes/No) must match
-  the encoders used during training.
+- Category encodings (locations, wind directions) are loaded from the
+  ``categories.json`` written by ``src/data_processing.py``, so they always
+  match the codes the model was trained on.
+- The model graph is produced offline by ``src/model_export.py``.
 - The UI is defined in ``templates/index.html`` and uses ``static/style.css``.
 """
 
@@ -31,21 +36,37 @@ from __future__ import annotations
 # Standard library imports
 # -------------------------------------------------------------------
 import datetime as dt
-from typing import Any, Dict, List
+import functools
+import json
+import math
+import os
+import threading
+from typing import Any, Dict, List, Tuple
+
+# Single-row requests gain nothing from OpenMP threads; pin before the
+# XGBoost / ONNX Runtime libraries initialise their thread pools. Numba's
+# ``prange`` pool is capped too, since every gunicorn worker would otherwise
+# start one thread per host core for ``/predict_batch``.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("NUMBA_NUM_THREADS", "1")
 
 # -------------------------------------------------------------------
 # Third-party imports
 # -------------------------------------------------------------------
-import joblib
 import numpy as np
-from flask import Flask, render_template, request
+import onnxruntime as ort
+from flask import Flask, Response, jsonify, request
 
 # -------------------------------------------------------------------
-# Internal logging/exception setup (fallbacks if not installed)
+# Internal imports
+# -------------------------------------------------------------------
+from src.heuristics import BATCH_FEATURE_ORDER, build_features, compute_heuristics
+
+# -------------------------------------------------------------------
+# Internal logging setup (fallback if not installed)
 # -------------------------------------------------------------------
 try:
     from src.logger import get_logger
-    from src.custom_exception import CustomException
 
     logger = get_logger(__name__)
 except Exception:  # pragma: no cover - defensive fallback if src/* unavailable
@@ -54,9 +75,17 @@ except Exception:  # pragma: no cover - defensive fallback if src/* unavailable
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
 
-    class CustomException(Exception):
-        """Fallback CustomException if src modules are not yet available."""
-        pass
+
+# -------------------------------------------------------------------
+# Exceptions
+# -------------------------------------------------------------------
+class ValidationError(ValueError):
+    """
+    Lightweight, user-facing input error carrying only a message.
+
+    Unlike ``CustomException`` it does not walk or format the traceback, so
+    rejecting bad form input stays cheap.
+    """
 
 
 # -------------------------------------------------------------------
@@ -65,35 +94,65 @@ except Exception:  # pragma: no cover - defensive fallback if src/* unavailable
 # Create Flask application
 app = Flask(__name__)
 
-# Path to the trained model artefact
-MODEL_PATH: str = "artifacts/models/model.pkl"
+# Serving backend: "onnx" (default) or "xgboost" (native Booster, no sklearn wrapper)
+MODEL_BACKEND: str = os.environ.get("MODEL_BACKEND", "onnx").lower()
+
+# Paths to the model artefacts for each backend
+MODEL_PATHS: Dict[str, str] = {
+    "onnx": "artifacts/models/model.onnx",
+    "xgboost": "artifacts/models/model.json",
+}
+MODEL_PATH: str = MODEL_PATHS[MODEL_BACKEND]
 
 # Load model at import time (fail fast if missing)
-model = joblib.load(MODEL_PATH)
-logger.info("Model loaded from %s", MODEL_PATH)
+if MODEL_BACKEND == "xgboost":
+    # Imported lazily: the default ONNX backend does not need XGBoost at all
+    import xgboost as xgb
+
+    booster = xgb.Booster()
+    booster.load_model(MODEL_PATH)
+else:
+    # Full graph optimisation; one thread per session since a single row gains
+    # nothing from intra-op parallelism (scale out with gunicorn workers instead)
+    so = ort.SessionOptions()
+    so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    so.intra_op_num_threads = 1
+    so.inter_op_num_threads = 1
+    so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+
+    # Single-row requests use tiny, fixed-size tensors (bound once via IOBinding),
+    # so the CPU arena and memory-pattern planner only add footprint. Set
+    # ORT_CPU_MEM_ARENA=1 when /predict_batch traffic dominates.
+    use_arena = os.environ.get("ORT_CPU_MEM_ARENA") == "1"
+    so.enable_cpu_mem_arena = use_arena
+    so.enable_mem_pattern = use_arena
+    sess = ort.InferenceSession(MODEL_PATH, so, providers=["CPUExecutionProvider"])
+    input_name: str = sess.get_inputs()[0].name
+    label_name: str = sess.get_outputs()[0].name
+
+# Per-thread ONNX IOBinding with persistent input/output buffers
+_onnx_local = threading.local()
+logger.info("Model loaded from %s (backend: %s)", MODEL_PATH, MODEL_BACKEND)
 
 
 # -------------------------------------------------------------------
-# Encoders / Choices (must match training encodings exactly)
+# Encoders / Choices (loaded from the training-time vocabularies)
 # -------------------------------------------------------------------
-WIND_DIRS: List[str] = [
-    "N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-    "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW",
-]
+# Written by ``DataProcessing.save_categories`` (``CATEGORIES_FILE`` in
+# ``src/data_processing.py``): column → sorted categories, code = position
+CATEGORIES_PATH: str = "artifacts/processed/categories.json"
+
+with open(CATEGORIES_PATH, encoding="utf-8") as _f:
+    CATEGORIES: Dict[str, List[str]] = json.load(_f)
+
+# The heuristics kernels encode RainToday as No=0 / Yes=1; fail fast otherwise
+if CATEGORIES["RainToday"] != ["No", "Yes"]:
+    raise RuntimeError(f"Unexpected RainToday encoding in {CATEGORIES_PATH}: {CATEGORIES['RainToday']}")
+
+WIND_DIRS: List[str] = CATEGORIES["WindDir3pm"]
 WIND_DIR_MAP: Dict[str, int] = {d: i for i, d in enumerate(WIND_DIRS)}
 
-YES_NO_MAP: Dict[str, int] = {"No": 0, "Yes": 1}
-
-LOCATIONS: List[str] = [
-    "Adelaide", "Albury", "AliceSprings", "BadgerysCreek", "Ballarat", "Bendigo",
-    "Brisbane", "Cairns", "Canberra", "Cobar", "CoffsHarbour", "Dartmoor", "Darwin",
-    "GoldCoast", "Hobart", "Katherine", "Launceston", "Melbourne", "MelbourneAirport",
-    "Mildura", "Moree", "MountGambier", "MountGinini", "Nhil", "NorahHead",
-    "NorfolkIsland", "Nuriootpa", "PearceRAAF", "Penrith", "Perth", "PerthAirport",
-    "Portland", "Richmond", "Sale", "SalmonGums", "Sydney", "SydneyAirport",
-    "Townsville", "Tuggeranong", "Uluru", "WaggaWagga", "Walpole", "Watsonia",
-    "Williamtown", "Witchcliffe", "Wollongong", "Woomera",
-]
+LOCATIONS: List[str] = CATEGORIES["Location"]
 LOCATION_MAP: Dict[str, int] = {loc: i for i, loc in enumerate(LOCATIONS)}
 
 # Typical prevailing wind direction by broad region (rough defaults; tweak as needed)
@@ -106,6 +165,31 @@ PREVAILING_BY_LOCATION: Dict[str, str] = {
     "Darwin": "NW", "Katherine": "NW",
 }
 
+# Encoded prevailing wind direction indexed by encoded location id (default SW;
+# entries for locations outside LOCATIONS are ignored)
+PREVAILING_ENC_BY_LOCATION: np.ndarray = np.full(len(LOCATIONS), WIND_DIR_MAP["SW"], dtype=np.int8)
+for _loc, _dir in PREVAILING_BY_LOCATION.items():
+    if _loc in LOCATION_MAP:
+        PREVAILING_ENC_BY_LOCATION[LOCATION_MAP[_loc]] = WIND_DIR_MAP[_dir]
+
+
+# -------------------------------------------------------------------
+# Feature layout (must match training column order exactly)
+# -------------------------------------------------------------------
+# Only features the app can actually supply; 9am/gust duplicates of the 3pm
+# readings are not part of the training set (see ``FEATURE_COLUMNS`` in
+# ``src/data_processing.py``)
+FEATURE_ORDER: Tuple[str, ...] = (
+    "Location", "MinTemp", "MaxTemp", "Rainfall", "Evaporation",
+    "Sunshine", "WindDir3pm", "WindSpeed3pm", "Humidity3pm", "Pressure3pm",
+    "Cloud3pm", "RainToday", "Year", "Month", "Day",
+)
+N_FEATURES: int = len(FEATURE_ORDER)
+
+# The batch kernel writes columns positionally; fail fast if layouts drift
+if BATCH_FEATURE_ORDER != FEATURE_ORDER:
+    raise RuntimeError("src.heuristics.BATCH_FEATURE_ORDER does not match FEATURE_ORDER.")
+
 
 # -------------------------------------------------------------------
 # UI ranges & defaults
@@ -128,6 +212,17 @@ DEFAULTS: Dict[str, Any] = {
     "Rainfall": 0.0,  # optional; if > 0.2 → RainToday = Yes
 }
 
+# Posted fields consumed by inference, in cache-key order
+FORM_FIELDS: Tuple[str, ...] = (
+    "Location", "Date", "MinTemp", "MaxTemp", "Humidity3pm", "WindSpeed3pm", "Rainfall",
+)
+
+# Maximum number of distinct form submissions memoised per process
+INFERENCE_CACHE_SIZE: int = 1024
+
+# Maximum number of rows accepted by one ``/predict_batch`` request
+MAX_BATCH_ROWS: int = 1000
+
 
 # -------------------------------------------------------------------
 # Helpers: parsing
@@ -150,13 +245,20 @@ def _parse_float(name: str, value: str) -> float:
 
     Raises
     ------
-    CustomException
-        If conversion fails.
+    ValidationError
+        If the value is blank or not finite (``nan`` / ``inf``).
+    ValueError
+        If the value is not numeric; left to propagate to the route so the
+        happy path avoids a per-field ``try`` frame (inputs are
+        ``type="number"``, so this is rare).
     """
-    try:
-        return float(value)
-    except Exception as e:
-        raise CustomException(f"{name}: value must be numeric.") from e
+    v = value.strip()
+    if not v:
+        raise ValidationError(f"{name}: value must be numeric.")
+    x = float(v)
+    if not math.isfinite(x):
+        raise ValidationError(f"{name}: value must be a finite number.")
+    return x
 
 
 def _parse_float_in_range(name: str, value: str, lo: float, hi: float) -> float:
@@ -164,147 +266,88 @@ def _parse_float_in_range(name: str, value: str, lo: float, hi: float) -> float:
     Parse a float and validate that it lies within [lo, hi].
     """
     x = _parse_float(name, value)
-    if x < lo or x > hi:
-        raise CustomException(f"{name}: {x} out of range [{lo}, {hi}].")
+    if not lo <= x <= hi:
+        raise ValidationError(f"{name}: {x} out of range [{lo}, {hi}].")
     return x
 
 
-def _parse_int_in_range(name: str, value: str, lo: float, hi: float) -> int:
-    """
-    Parse a float in range and return the rounded integer value.
-    """
-    x = _parse_float_in_range(name, value, lo, hi)
-    return int(round(x))
-
-
+@functools.lru_cache(maxsize=INFERENCE_CACHE_SIZE)
 def _parse_date(value: str) -> dt.date:
     """
-    Parse YYYY-MM-DD into a date object.
+    Parse YYYY-MM-DD into a date object (memoised; failures are not cached).
 
     Raises
     ------
-    CustomException
+    ValidationError
         If the format is invalid.
     """
     try:
         return dt.date.fromisoformat(value)
-    except Exception as e:
-        raise CustomException("Date: invalid format (expected YYYY-MM-DD).") from e
+    except ValueError:
+        raise ValidationError("Date: invalid format (expected YYYY-MM-DD).") from None
 
 
 # -------------------------------------------------------------------
 # Helpers: inference (season/region heuristics)
 # -------------------------------------------------------------------
-def _season_of(month: int) -> str:
-    """
-    Map month to season (southern hemisphere).
-
-    Returns
-    -------
-    str
-        One of {'summer','autumn','winter','spring'}.
+def _form_key(form: Dict[str, str]) -> Tuple[str, ...]:
     """
-    if month in (12, 1, 2):
-        return "summer"
-    if month in (3, 4, 5):
-        return "autumn"
-    if month in (6, 7, 8):
-        return "winter"
-    return "spring"
+    Extract the inference inputs from a posted form as a hashable tuple.
 
-
-def _prevailing_dir_for_location(loc: str) -> str:
-    """
-    Get a typical prevailing wind direction for a location.
+    Missing fields fall back to ``DEFAULTS``; the order follows ``FORM_FIELDS``.
     """
-    return PREVAILING_BY_LOCATION.get(loc, "SW")
+    return tuple(form.get(k, str(DEFAULTS[k])) for k in FORM_FIELDS)
 
 
-def _infer_missing_features(form: Dict[str, str]) -> Dict[str, Any]:
+def _infer_missing_features(fields: Tuple[str, ...]) -> Dict[str, Any]:
     """
     Infer the full feature vector from minimal inputs.
 
     Parameters
     ----------
-    form : Dict[str, str]
-        Posted form dictionary.
+    fields : Tuple[str, ...]
+        Raw posted values in ``FORM_FIELDS`` order (see ``_form_key``).
 
     Returns
     -------
     Dict[str, Any]
         Mapping of all model feature names to numeric values, ready to be
-        ordered and fed to the model.
+        ordered and fed to the model (memoised via ``_features_for``).
     """
     # Parse minimal inputs
-    loc = form.get("Location", DEFAULTS["Location"])
-    date = _parse_date(form.get("Date", DEFAULTS["Date"]))
+    loc, date_str, min_temp_str, max_temp_str, hum_str, spd_str, rainfall_str = fields
+    date = _parse_date(date_str)
 
     min_temp = _parse_float_in_range(
-        "MinTemp", form.get("MinTemp", str(DEFAULTS["MinTemp"])),
-        RANGES["MinTemp"]["min"], RANGES["MinTemp"]["max"],
+        "MinTemp", min_temp_str, RANGES["MinTemp"]["min"], RANGES["MinTemp"]["max"],
     )
     max_temp = _parse_float_in_range(
-        "MaxTemp", form.get("MaxTemp", str(DEFAULTS["MaxTemp"])),
-        RANGES["MaxTemp"]["min"], RANGES["MaxTemp"]["max"],
-    )
-    hum_3pm = _parse_int_in_range(
-        "Humidity3pm", form.get("Humidity3pm", str(DEFAULTS["Humidity3pm"])),
-        RANGES["Humidity3pm"]["min"], RANGES["Humidity3pm"]["max"],
-    )
-    spd_3pm = _parse_int_in_range(
-        "WindSpeed3pm", form.get("WindSpeed3pm", str(DEFAULTS["WindSpeed3pm"])),
-        RANGES["WindSpeed3pm"]["min"], RANGES["WindSpeed3pm"]["max"],
+        "MaxTemp", max_temp_str, RANGES["MaxTemp"]["min"], RANGES["MaxTemp"]["max"],
     )
+    # Integer inputs step by 1 in the UI: range-checked like the others, then
+    # truncated (same rule as ``/predict_batch``)
+    hum_3pm = int(_parse_float_in_range(
+        "Humidity3pm", hum_str, RANGES["Humidity3pm"]["min"], RANGES["Humidity3pm"]["max"],
+    ))
+    spd_3pm = int(_parse_float_in_range(
+        "WindSpeed3pm", spd_str, RANGES["WindSpeed3pm"]["min"], RANGES["WindSpeed3pm"]["max"],
+    ))
     rainfall = _parse_float_in_range(
-        "Rainfall", form.get("Rainfall", str(DEFAULTS["Rainfall"])),
-        RANGES["Rainfall"]["min"], RANGES["Rainfall"]["max"],
+        "Rainfall", rainfall_str, RANGES["Rainfall"]["min"], RANGES["Rainfall"]["max"],
     )
 
     # Calendar fields
     year, month, day = date.year, date.month, date.day
-    season = _season_of(month)
-
-    # Temperature heuristics
-    # 3pm temperature tends towards daily max; lightly season-weighted
-    temp3pm = min(max_temp, max(min_temp, (min_temp + 0.7 * max_temp) / 1.7))
-    # 9am temperature closer to daily min
-    temp9am = max(min_temp, min(max_temp, (0.6 * min_temp + 0.4 * max_temp)))
-
-    # Sunshine hours by season (fallbacks)
-    sunshine = {"summer": 9.0, "autumn": 7.0, "winter": 5.0, "spring": 8.0}.get(season, 7.0)
-
-    # Cloud (oktas 0–8) from humidity
-    cloud3pm = int(round((hum_3pm / 100.0) * 8))
-    cloud3pm = max(0, min(8, cloud3pm))
-    cloud9am = cloud3pm
-
-    # Pressure heuristic (hPa): base 1015 − small humidity adjustment
-    pressure3pm = float(round(1015.0 - 0.08 * (hum_3pm - 50), 1))
-    pressure9am = pressure3pm
-
-    # Wind directions: use prevailing for location
-    dir3pm = _prevailing_dir_for_location(loc)
-    dir9am = dir3pm
-    gust_dir = dir3pm  # preserved for clarity, encoded below
-
-    # Gust speed ≈ 3pm wind + 20, bounded
-    gust_speed = int(min(150, max(spd_3pm + 20, spd_3pm)))
-
-    # 9am wind typically a little lighter
-    spd_9am = int(max(0, spd_3pm - 3))
 
-    # Evaporation: function of sunshine & diurnal range (empirical)
-    evaporation = max(0.0, 0.12 * sunshine + 0.03 * (max_temp - min_temp))
-
-    # RainToday derived from rainfall threshold
-    rain_today = "Yes" if rainfall > 0.2 else "No"
+    # Numeric heuristics (sunshine, cloud, pressure, evaporation, rain)
+    sunshine, cloud3pm, pressure3pm, evaporation, rain_today_enc = compute_heuristics(
+        min_temp, max_temp, hum_3pm, rainfall, month
+    )
 
-    # Encode categoricals to integers matching training
+    # Encode categoricals to integers matching training; wind direction uses
+    # the location's prevailing direction
     loc_enc = LOCATION_MAP.get(loc, 0)
-    dir3pm_enc = WIND_DIR_MAP.get(dir3pm, WIND_DIR_MAP["SW"])
-    dir9am_enc = dir3pm_enc
-    gust_dir_enc = dir3pm_enc
-    rain_today_enc = YES_NO_MAP[rain_today]
+    dir3pm_enc = int(PREVAILING_ENC_BY_LOCATION[loc_enc])
 
     # Assemble all inferred fields
     return {
@@ -314,20 +357,11 @@ def _infer_missing_features(form: Dict[str, str]) -> Dict[str, Any]:
         "Rainfall": rainfall,
         "Evaporation": evaporation,
         "Sunshine": sunshine,
-        "WindGustDir": gust_dir_enc,
-        "WindGustSpeed": gust_speed,
-        "WindDir9am": dir9am_enc,
         "WindDir3pm": dir3pm_enc,
-        "WindSpeed9am": spd_9am,
         "WindSpeed3pm": spd_3pm,
-        "Humidity9am": hum_3pm,
         "Humidity3pm": hum_3pm,
-        "Pressure9am": pressure9am,
         "Pressure3pm": pressure3pm,
-        "Cloud9am": cloud9am,
         "Cloud3pm": cloud3pm,
-        "Temp9am": temp9am,
-        "Temp3pm": temp3pm,
         "RainToday": rain_today_enc,
         "Year": year,
         "Month": month,
@@ -347,17 +381,228 @@ def _build_feature_vector_from_inferred(vals: Dict[str, Any]) -> np.ndarray:
     Returns
     -------
     np.ndarray
-        A single-row 2D array (shape: (1, n_features)).
+        A single-row 2D ``float32`` array (shape: (1, n_features)).
+
+    Notes
+    -----
+    A fresh buffer is allocated per call so concurrent requests on a threaded
+    server never share state; this is still cheaper than list + ``np.array``.
+    """
+    X = np.empty((1, N_FEATURES), dtype=np.float32)
+    for i, key in enumerate(FEATURE_ORDER):
+        X[0, i] = vals[key]
+    return X
+
+
+def _batch_feature_matrix(rows: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Build an ``(n, N_FEATURES)`` feature matrix from a list of input objects.
+
+    Parameters
+    ----------
+    rows : List[Dict[str, Any]]
+        One mapping per prediction with the ``FORM_FIELDS`` keys (at most
+        ``MAX_BATCH_ROWS``); missing keys fall back to ``DEFAULTS``.
+        ``Location`` and ``Date`` must be strings, numeric fields may be
+        numbers or numeric strings.
+
+    Returns
+    -------
+    np.ndarray
+        A ``float32`` matrix in training column order.
+
+    Raises
+    ------
+    ValidationError
+        If the payload is malformed, too large, or a value has the wrong type
+        or is out of range.
     """
-    ordered = [
-        vals["Location"], vals["MinTemp"], vals["MaxTemp"], vals["Rainfall"],
-        vals["Evaporation"], vals["Sunshine"], vals["WindGustDir"], vals["WindGustSpeed"],
-        vals["WindDir9am"], vals["WindDir3pm"], vals["WindSpeed9am"], vals["WindSpeed3pm"],
-        vals["Humidity9am"], vals["Humidity3pm"], vals["Pressure9am"], vals["Pressure3pm"],
-        vals["Cloud9am"], vals["Cloud3pm"], vals["Temp9am"], vals["Temp3pm"],
-        vals["RainToday"], vals["Year"], vals["Month"], vals["Day"],
-    ]
-    return np.array([ordered], dtype=float)
+    if not isinstance(rows, list) or not rows or not all(isinstance(r, dict) for r in rows):
+        raise ValidationError("Body must be a non-empty JSON list of input objects.")
+    if len(rows) > MAX_BATCH_ROWS:
+        raise ValidationError(f"Body has {len(rows)} rows; at most {MAX_BATCH_ROWS} are accepted.")
+
+    def column(key: str) -> List[Any]:
+        return [r.get(key, DEFAULTS[key]) for r in rows]
+
+    def text_column(key: str) -> List[str]:
+        values = column(key)
+        bad = [i for i, v in enumerate(values) if not isinstance(v, str)]
+        if bad:
+            raise ValidationError(f"{key}: expected a string at rows {bad}.")
+        return values
+
+    # Calendar fields from one datetime64[D] array (strings only: numpy would
+    # read a bare number as days since the epoch)
+    date_strs = text_column("Date")
+    try:
+        dates = np.asarray(date_strs, dtype="datetime64[D]")
+    except ValueError:
+        dates = None
+    if dates is None or np.isnat(dates).any():
+        raise ValidationError("Date: invalid format (expected YYYY-MM-DD).")
+    month_start = dates.astype("datetime64[M]")
+    year = dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    month = month_start.astype(np.int64) % 12 + 1
+    day = (dates - month_start).astype(np.int64) + 1
+
+    # Numeric inputs with one vectorised range check per field
+    nums: Dict[str, np.ndarray] = {}
+    for name, spec in RANGES.items():
+        try:
+            arr = np.asarray(column(name), dtype=np.float64)
+        except (TypeError, ValueError):
+            raise ValidationError(f"{name}: values must be numbers or numeric strings.") from None
+        bad = np.flatnonzero(~((arr >= spec["min"]) & (arr <= spec["max"])))  # NaN fails too
+        if bad.size:
+            raise ValidationError(
+                f"{name}: out of range [{spec['min']}, {spec['max']}] at rows {bad.tolist()}."
+            )
+        nums[name] = arr
+
+    # Whole-number inputs are truncated, as in the form path
+    hum_3pm = np.trunc(nums["Humidity3pm"])
+    spd_3pm = np.trunc(nums["WindSpeed3pm"])
+
+    # Categorical encodings
+    loc_enc = np.fromiter(
+        (LOCATION_MAP.get(loc, 0) for loc in text_column("Location")), dtype=np.int32, count=len(rows)
+    )
+
+    # Heuristics and column assembly in one parallel pass
+    X = np.empty((len(rows), N_FEATURES), dtype=np.float32)
+    build_features(
+        nums["MinTemp"], nums["MaxTemp"], hum_3pm, spd_3pm, nums["Rainfall"],
+        year, month, day, loc_enc, PREVAILING_ENC_BY_LOCATION, X,
+    )
+    return X
+
+
+@functools.lru_cache(maxsize=INFERENCE_CACHE_SIZE)
+def _features_for(fields: Tuple[str, ...]) -> np.ndarray:
+    """
+    Return the memoised, read-only feature matrix for a form input tuple.
+
+    Parameters
+    ----------
+    fields : Tuple[str, ...]
+        Raw posted values in ``FORM_FIELDS`` order (see ``_form_key``).
+
+    Returns
+    -------
+    np.ndarray
+        A single-row ``float32`` matrix in training column order.
+    """
+    X = _build_feature_vector_from_inferred(_infer_missing_features(fields))
+    X.flags.writeable = False
+    return X
+
+
+def _onnx_binding() -> Tuple[Any, np.ndarray, np.ndarray]:
+    """
+    Return this thread's IOBinding together with its bound buffers.
+
+    The input and output ``OrtValue`` objects wrap numpy arrays that are
+    allocated once per thread, so each run writes into existing memory
+    instead of allocating tensors on the request path.
+
+    Returns
+    -------
+    Tuple[Any, np.ndarray, np.ndarray]
+        ``(io_binding, x_buf, y_buf)`` where ``x_buf`` has shape
+        ``(1, N_FEATURES)`` and ``y_buf`` receives the predicted label.
+    """
+    binding = getattr(_onnx_local, "binding", None)
+    if binding is None:
+        x_buf = np.zeros((1, N_FEATURES), dtype=np.float32)
+        y_buf = np.zeros((1,), dtype=np.int64)  # label output of the converted classifier
+        io = sess.io_binding()
+        io.bind_ortvalue_input(input_name, ort.OrtValue.ortvalue_from_numpy(x_buf))
+        io.bind_ortvalue_output(label_name, ort.OrtValue.ortvalue_from_numpy(y_buf))
+        binding = _onnx_local.binding = (io, x_buf, y_buf)
+    return binding
+
+
+def _predict(X: np.ndarray) -> int:
+    """
+    Run single-row inference on the configured backend.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        A single-row ``float32`` feature matrix.
+
+    Returns
+    -------
+    int
+        Predicted class (1 = rain tomorrow, 0 = no rain).
+    """
+    if MODEL_BACKEND == "xgboost":
+        # ``inplace_predict`` skips sklearn validation and DMatrix construction
+        return int(booster.inplace_predict(X)[0] > 0.5)
+    io, x_buf, y_buf = _onnx_binding()
+    x_buf[...] = X
+    sess.run_with_iobinding(io)
+    return int(y_buf[0])
+
+
+def _predict_batch(X: np.ndarray) -> np.ndarray:
+    """
+    Run inference for many rows with a single backend call.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        A ``float32`` feature matrix of shape ``(n, N_FEATURES)``.
+
+    Returns
+    -------
+    np.ndarray
+        Predicted classes (1 = rain tomorrow, 0 = no rain), shape ``(n,)``.
+    """
+    if MODEL_BACKEND == "xgboost":
+        return (booster.inplace_predict(X) > 0.5).astype(np.int64)
+    return sess.run([label_name], {input_name: X})[0].astype(np.int64)
+
+
+# -------------------------------------------------------------------
+# Templates
+# -------------------------------------------------------------------
+def _render_index(**context: Any) -> str:
+    """
+    Render ``index.html`` with Flask's standard template context.
+
+    Jinja's environment caches the compiled template and only re-checks the
+    file when auto-reload is on (e.g. ``FLASK_DEBUG``).
+    """
+    app.update_template_context(context)
+    return app.jinja_env.get_template("index.html").render(context)
+
+
+# The empty-form GET page only varies with the mount point (``url_for`` bakes
+# in ``SCRIPT_NAME``), so it is rendered on the first real request per root
+_EMPTY_GET_HTML: Dict[str, bytes] = {}
+
+
+def _empty_index() -> bytes:
+    """
+    Return the empty-form page for the current request's script root.
+
+    Rendered lazily inside the real request context and memoised, except when
+    templates auto-reload, so edits show up during development.
+    """
+    html = _EMPTY_GET_HTML.get(request.script_root)
+    if html is None:
+        html = _render_index(
+            prediction=None,
+            error=None,
+            inputs=DEFAULTS.copy(),
+            ranges=RANGES,
+            choices={"locations": LOCATIONS},
+        ).encode("utf-8")
+        if not app.jinja_env.auto_reload:
+            _EMPTY_GET_HTML[request.script_root] = html
+    return html
 
 
 # -------------------------------------------------------------------
@@ -370,41 +615,51 @@ def index():
 
     Workflow
     --------
-    1) Copy DEFAULTS to preserve UI state.
-    2) On POST, parse inputs and infer the remaining features.
-    3) Build the ordered feature vector, predict, and render the result.
+    1) On GET, return the (memoised) empty form.
+    2) On POST, copy DEFAULTS to preserve UI state.
+    3) Parse inputs and infer the remaining features.
+    4) Build the ordered feature vector, predict, and render the result.
     """
+    if request.method == "GET":
+        return Response(_empty_index(), mimetype="text/html")
+
     prediction: str | None = None
     error: str | None = None
 
     # Maintain user inputs across requests
     inputs = DEFAULTS.copy()
 
-    if request.method == "POST":
-        try:
-            # Infer all model features from minimal inputs
-            inferred = _infer_missing_features(request.form)
-
-            # Build the single-row feature matrix in training order
-            X = _build_feature_vector_from_inferred(inferred)
-
-            # Reflect posted UI values back into the form
-            for k in inputs:
-                if k in request.form and request.form[k]:
-                    inputs[k] = request.form[k]
-
-            # Run model inference
-            y_pred = model.predict(X)[0]
-            prediction = "Rain Tomorrow: Yes" if int(y_pred) == 1 else "Rain Tomorrow: No"
-            logger.info("Prediction successful: %s", prediction)
-
-        except Exception as e:  # keep broad to surface validation errors to UI
-            error = str(e)
-            logger.error("Prediction failed: %s", error)
+    try:
+        # Infer all model features from minimal inputs and build the
+        # single-row feature matrix in training order (memoised per input)
+        X = _features_for(_form_key(request.form))
+
+        # Reflect posted UI values back into the form
+        for k in inputs:
+            if k in request.form and request.form[k]:
+                inputs[k] = request.form[k]
+
+        # Run model inference
+        y_pred = _predict(X)
+        prediction = "Rain Tomorrow: Yes" if y_pred == 1 else "Rain Tomorrow: No"
+        logger.info("Prediction successful: %s", prediction)
+
+    except ValidationError as e:
+        # Expected user-input problems: message only, no traceback
+        error = str(e)
+        logger.error("Prediction failed: %s", error)
+
+    except ValueError as e:
+        # Non-numeric values from ``float()`` surface here, once per request
+        error = f"Inputs must be numeric ({e})."
+        logger.error("Prediction failed: %s", error)
+
+    except Exception as e:  # unexpected server-side failure
+        error = str(e)
+        logger.exception("Prediction failed: %s", e)
 
     # Render the Jinja template with current state
-    return render_template(
-        "index.html",
+    return _render_index(
         prediction=prediction,
         error=error,
         inputs=inputs,
@@ -413,9 +668,43 @@ def index():
     )
 
 
+@app.route("/predict_batch", methods=["POST"])
+def predict_batch():
+    """
+    Score a JSON list of inputs in one vectorised model call.
+
+    Request body
+    ------------
+    ``[{"Location": "Sydney", "Date": "2025-01-15", "MinTemp": 18, ...}, ...]``
+    using the same fields as the form; omitted fields use ``DEFAULTS``.
+
+    Returns
+    -------
+    JSON list of ``"Yes"`` / ``"No"`` (rain tomorrow), one per input, or
+    ``{"error": ...}`` with status 400 (bad input) / 500 (server error).
+    """
+    try:
+        X = _batch_feature_matrix(request.get_json(silent=True))
+        y_pred = _predict_batch(X)
+        logger.info("Batch prediction successful: %d rows", len(y_pred))
+        return jsonify(["Yes" if y == 1 else "No" for y in y_pred.tolist()])
+
+    except ValueError as e:  # includes ValidationError
+        logger.error("Batch prediction failed: %s", e)
+        return jsonify({"error": str(e)}), 400
+
+    except Exception as e:  # unexpected server-side failure
+        logger.exception("Batch prediction failed: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+
 # -------------------------------------------------------------------
 # Entrypoint
 # -------------------------------------------------------------------
 if __name__ == "__main__":
-    # Expose on all interfaces for containerised runs; disable debug in production.
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    # Local development only; production runs under gunicorn:
+    #     gunicorn -c gunicorn.conf.py app:app
+    logger.warning("Running the Flask development server; use gunicorn in production.")
+
+    # Debug mode (reloader + tracebacks) is opt-in via FLASK_DEBUG=1
+    app.run(host="0.0.0.0", port=5000, debug=os.environ.get("FLASK_DEBUG") == "1")
@@ -0,0 +1,74 @@
+"""
+gunicorn.conf.py
+----------------
+Production server configuration for the Weather Prediction Flask app.
+
+Serving is dominated by per-request overhead rather than model compute, so
+the app runs as many single-threaded worker processes (one per available
+CPU) instead of one multi-threaded process. Workers use the ``gthread`` class with
+a single request thread: requests are still handled one at a time, but idle
+HTTP/1.1 connections are kept alive so repeat clients skip the TCP
+handshake (the ``sync`` worker closes every connection after one response).
+Each worker owns its own model session, and ``OMP_NUM_THREADS=1`` (set in
+``app.py``) keeps the native libraries from oversubscribing cores.
+
+Usage
+-----
+From the project root:
+    gunicorn -c gunicorn.conf.py app:app
+
+Notes
+-----
+- ``keepalive`` should exceed the upstream load balancer's idle timeout so
+  the proxy, not gunicorn, decides when to drop connections.
+- The default worker count follows the container's CPU limit (cgroup
+  ``cpu.max``) when one is set, otherwise the CPUs the process may run on.
+  A CPU *request* is not visible from inside the pod, so deployments that
+  only set requests should pin ``GUNICORN_WORKERS`` explicitly (see
+  ``kubernetes-deployment.yaml``).
+"""
+
+# -------------------------------------------------------------------
+# Standard Library Imports
+# -------------------------------------------------------------------
+import math
+import os
+
+# -------------------------------------------------------------------
+# Server Socket
+# -------------------------------------------------------------------
+bind = "0.0.0.0:5000"
+
+# -------------------------------------------------------------------
+# Worker Processes
+# -------------------------------------------------------------------
+def _available_cpus() -> int:
+    """
+    Return the number of CPUs this container may actually use.
+
+    Returns
+    -------
+    int
+        ``ceil(quota / period)`` from the cgroup v2 CPU limit when one is set,
+        otherwise the size of the process's CPU affinity set (at least 1).
+    """
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as fh:
+            quota, period = fh.read().split()
+        if quota != "max":
+            return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+workers = int(os.environ.get("GUNICORN_WORKERS", _available_cpus()))
+threads = 1
+worker_class = "gthread"
+
+# -------------------------------------------------------------------
+# Connections
+# -------------------------------------------------------------------
+keepalive = 65
@@ -8,6 +8,7 @@ Overview
 This module acts as the orchestration script that chains together all core workflow stages:
 1) Data preprocessing (via ``DataProcessing``)
 2) Model training and evaluation (via ``ModelTraining``)
+3) ONNX export and parity validation (via ``ModelExport``)
 
 It ensures that raw weather data is cleaned, encoded, split, and then used to train
 and evaluate an XGBoost model — producing reproducible artefacts ready for deployment.
@@ -24,6 +25,7 @@ from __future__ import annotations
 # -------------------------------------------------------------------
 from src.data_processing import DataProcessing
 from src.model_training import ModelTraining
+from src.model_export import ModelExport
 
 
 # -------------------------------------------------------------------
@@ -37,6 +39,7 @@ if __name__ == "__main__":
     -----
     1) Run data preprocessing to generate clean train/test artefacts.
     2) Run model training and evaluation using those processed artefacts.
+    3) Export the trained model to ONNX for serving.
     """
 
     # -------------------------------------------------------------------
@@ -44,10 +47,12 @@ if __name__ == "__main__":
     # -------------------------------------------------------------------
     processor = DataProcessing(
         input_path="artifacts/raw/data.csv",
-        output_path="artifacts/processed"
+        output_path="artifacts/processed",
+        verify_arrow=True
     )
 
-    # Execute preprocessing pipeline (cleaning, encoding, splitting)
+    # Execute preprocessing pipeline (cleaning, encoding, splitting); the Arrow
+    # fast path is checked against the pandas steps on every build
     processor.run()
 
     # -------------------------------------------------------------------
@@ -60,3 +65,14 @@ if __name__ == "__main__":
 
     # Execute model training, evaluation, and persistence
     trainer.run()
+
+    # -------------------------------------------------------------------
+    # Stage 3: ONNX Export
+    # -------------------------------------------------------------------
+    exporter = ModelExport(
+        model_dir="artifacts/models",
+        data_dir="artifacts/processed"
+    )
+
+    # Convert, validate against XGBoost, and persist the ONNX graph
+    exporter.run()
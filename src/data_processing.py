@@ -8,18 +8,33 @@ Overview
 This module provides a minimal, reproducible data-preparation stage used in the
 project setup. It:
 1) Loads a CSV dataset from disk
+   (pyarrow's multithreaded reader when installed, pandas otherwise)
 2) Performs basic datetime expansion and numeric imputation
 3) Applies label encoding to selected categorical columns
-4) Splits the data into train/test sets
-5) Persists splits to ``artifacts/processed/`` using Joblib
+4) Downcasts columns to compact dtypes (float32 / int8 / int16)
+5) Splits the data into train/test sets
+6) Persists both splits to ``artifacts/processed/processed.parquet`` (zstd)
+   and the label-encoding vocabularies to ``categories.json``
 
 Notes
 -----
 - Datetime handling expands a ``Date`` column into ``Year``, ``Month``, and ``Day``.
+- Only ``FEATURE_COLUMNS`` are kept as model inputs: the web app cannot supply
+  distinct 9am, gust, or temperature readings, so those columns are dropped
+  rather than fed to the model as duplicates of the 3pm values.
 - Numeric columns are imputed with the mean; residual missing values are dropped.
+- With pyarrow installed, loading through downcasting runs as one Arrow
+  compute pipeline (``process_arrow``); the pandas steps are the fallback.
+- ``run`` is skipped when ``_manifest.json`` shows ``processed.parquet`` was
+  already built from the same input (size + mtime fingerprint).
+- ``chunksize`` streams large CSVs: column projection and ``Date`` expansion
+  run per chunk, while mean imputation still uses whole-dataset means.
 - Saved artefacts:
-  * ``X_train.pkl``, ``X_test.pkl`` — feature matrices
-  * ``y_train.pkl``, ``y_test.pkl`` — target vectors
+  * ``processed.parquet`` — features and target for both splits, with a
+    ``_split`` column (0 = train, 1 = test); read back per split with
+    ``load_split``
+  * ``categories.json`` — sorted categories per encoded column (a value's
+    code is its list position); ``app.py`` builds its encoders from it
 
 Examples
 --------
@@ -32,13 +47,25 @@ from __future__ import annotations
 # -------------------------------------------------------------------
 # Standard & third-party imports
 # -------------------------------------------------------------------
+import hashlib
+import json
+import logging
 import os
-from typing import List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import joblib
+import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder
+from numba import njit, prange
+
+# Optional fast CSV reader (multithreaded C++ parser); pandas is the fallback
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pa_csv
+except ImportError:  # pragma: no cover - pyarrow is an optional accelerator
+    pa = None
 
 # -------------------------------------------------------------------
 # Internal imports
@@ -51,6 +78,119 @@ from src.custom_exception import CustomException
 # -------------------------------------------------------------------
 logger = get_logger(__name__)
 
+# -------------------------------------------------------------------
+# Feature set (must match ``FEATURE_ORDER`` in ``app.py``)
+# -------------------------------------------------------------------
+FEATURE_COLUMNS: List[str] = [
+    "Location", "MinTemp", "MaxTemp", "Rainfall", "Evaporation",
+    "Sunshine", "WindDir3pm", "WindSpeed3pm", "Humidity3pm", "Pressure3pm",
+    "Cloud3pm", "RainToday", "Year", "Month", "Day",
+]
+TARGET_COLUMN: str = "RainTomorrow"
+
+# Text columns in the raw CSV that are label-encoded downstream
+CATEGORICAL_COLUMNS: List[str] = ["Location", "WindDir3pm", "RainToday", TARGET_COLUMN]
+
+# Feature columns derived from ``Date`` rather than read from the file
+DATE_PARTS: Tuple[str, ...] = ("Year", "Month", "Day")
+
+# Processed artefact: both splits in one Parquet file, tagged 0=train / 1=test
+PROCESSED_FILE: str = "processed.parquet"
+SPLIT_COLUMN: str = "_split"
+
+# Records the input fingerprint the processed artefact was built from
+MANIFEST_FILE: str = "_manifest.json"
+
+# Label-encoding vocabularies (column → categories in code order), read by ``app.py``
+CATEGORIES_FILE: str = "categories.json"
+
+
+# -------------------------------------------------------------------
+# Kernel: mean imputation
+# -------------------------------------------------------------------
+# No ``fastmath``: it lets LLVM assume values are never NaN and drop the checks
+@njit(parallel=True, cache=True)
+def _fillna_mean(values):
+    """
+    Replace NaNs in each column of ``values`` with that column's mean, in place.
+
+    Columns are processed in parallel with ``prange``; each one takes a sum
+    and count pass, then a fill pass. Sums accumulate in ``float64``.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        ``float32`` matrix of shape ``(n_rows, n_cols)``, ideally
+        Fortran-ordered so each column is contiguous.
+    """
+    n_rows, n_cols = values.shape
+    for j in prange(n_cols):
+        total = 0.0
+        count = 0
+        for i in range(n_rows):
+            v = values[i, j]
+            if not np.isnan(v):
+                total += v
+                count += 1
+
+        # All-missing columns stay NaN and are dropped downstream
+        if count == 0:
+            continue
+
+        mean = total / count
+        for i in range(n_rows):
+            if np.isnan(values[i, j]):
+                values[i, j] = mean
+
+
+# -------------------------------------------------------------------
+# Function: load_split
+# -------------------------------------------------------------------
+def load_split(directory: str, name: str) -> pd.DataFrame | pd.Series | np.ndarray:
+    """
+    Load one split from the artefacts written by ``DataProcessing.split_data``.
+
+    Parameters
+    ----------
+    directory : str
+        Processed artefacts directory (e.g., ``artifacts/processed``).
+    name : str
+        Split name: ``X_train``, ``X_test``, ``y_train`` or ``y_test``.
+
+    Returns
+    -------
+    pd.DataFrame | pd.Series | np.ndarray
+        Feature matrix, or the target as an ``int8`` array for ``y_*`` splits
+        (whatever was pickled when read from a legacy artefact).
+
+    Notes
+    -----
+    - Rows come from ``processed.parquet``, filtered on ``_split`` so row
+      groups of the other split are skipped, reading only the requested
+      columns.
+    - Without ``processed.parquet``, the legacy ``<name>.pkl`` artefact is
+      read instead.
+    - Parquet is opened with pyarrow's ``memory_map`` so the compressed pages
+      are read without an extra file buffer, but decoding (zstd) still
+      produces private, in-memory copies of the columns.
+    - Legacy pickles are loaded with ``mmap_mode="r"``, so their numpy
+      buffers are memory-mapped, paged in on demand and read-only.
+    """
+    is_target = name.startswith("y_")
+
+    processed_path = os.path.join(directory, PROCESSED_FILE)
+    if not os.path.exists(processed_path):
+        return joblib.load(os.path.join(directory, f"{name}.pkl"), mmap_mode="r")
+
+    frame = pd.read_parquet(
+        processed_path,
+        engine="pyarrow",
+        columns=[TARGET_COLUMN] if is_target else FEATURE_COLUMNS,
+        filters=[(SPLIT_COLUMN, "==", 0 if name.endswith("_train") else 1)],
+        memory_map=True,
+    )
+    return frame[TARGET_COLUMN].to_numpy(dtype=np.int8) if is_target else frame
+
 
 # -------------------------------------------------------------------
 # Class: DataProcessing
@@ -66,6 +206,13 @@ class DataProcessing:
     output_path : str
         Directory where processed artefacts are persisted
         (e.g., ``artifacts/processed``).
+    chunksize : int | None, default=None
+        If set, stream the CSV in chunks of roughly this many rows, projecting
+        columns and expanding ``Date`` per chunk so the raw frame is never
+        held in memory at once.
+    verify_arrow : bool, default=False
+        After ``process_arrow``, also run the pandas steps and fail if the two
+        frames differ (a second full pass over the CSV).
 
     Attributes
     ----------
@@ -73,18 +220,36 @@ class DataProcessing:
         Source CSV path.
     output_path : str
         Target directory for persisted artefacts.
+    chunksize : int | None
+        Rows per streamed chunk, or ``None`` to read the file in one go.
+    verify_arrow : bool
+        Whether ``run`` checks the Arrow pipeline against the pandas steps.
     df : pd.DataFrame | None
         In-memory dataframe after loading.
+    categories : Dict[str, List[str]]
+        Sorted categories per ``CATEGORICAL_COLUMNS`` entry, filled by label
+        encoding (a value's code is its list position).
     """
 
-    def __init__(self, input_path: str, output_path: str) -> None:
+    def __init__(
+        self, input_path: str, output_path: str, chunksize: Optional[int] = None, verify_arrow: bool = False
+    ) -> None:
         # Store incoming CSV path and target output directory
         self.input_path: str = input_path
         self.output_path: str = output_path
 
+        # Optional streaming read for inputs that do not fit in memory
+        self.chunksize: Optional[int] = chunksize
+
+        # Optional parity check of the Arrow pipeline against the pandas steps
+        self.verify_arrow: bool = verify_arrow
+
         # Placeholder for the loaded dataframe
         self.df: Optional[pd.DataFrame] = None
 
+        # Encoding vocabularies recorded by label encoding
+        self.categories: Dict[str, List[str]] = {}
+
         # Ensure the output directory exists
         os.makedirs(self.output_path, exist_ok=True)
 
@@ -98,14 +263,22 @@ class DataProcessing:
         """
         Load the dataset from ``self.input_path`` into ``self.df``.
 
+        With ``chunksize`` set, each chunk is reduced by ``_preprocess_chunk``
+        as it is read and the reduced chunks are concatenated.
+
         Raises
         ------
         CustomException
             If the CSV cannot be read.
         """
         try:
-            # Read CSV into a dataframe
-            self.df = pd.read_csv(self.input_path)
+            if self.chunksize:
+                # Stream the CSV, keeping only each chunk's reduced form
+                chunks = [self._preprocess_chunk(chunk) for chunk in self._iter_csv_chunks()]
+                self.df = pd.concat(chunks, ignore_index=True)
+            else:
+                # Read CSV into a dataframe (pyarrow when available, else pandas)
+                self.df = self._read_csv_fast() if pa is not None else pd.read_csv(self.input_path)
 
             # Log success with basic shape info
             logger.info("Data loaded successfully. Shape: %s", None if self.df is None else self.df.shape)
@@ -116,15 +289,116 @@ class DataProcessing:
             # Re-raise using the project's custom exception (call pattern preserved)
             raise CustomException("Failed to load data", e)
 
+    # -------------------------------------------------------------------
+    # Helper: _arrow_convert_options
+    # -------------------------------------------------------------------
+    @staticmethod
+    def _arrow_convert_options() -> "pa_csv.ConvertOptions":
+        """
+        Build pyarrow conversion options that parse only ``Date``, the raw
+        feature columns, and the target, each with an explicit type so no
+        inference pass is needed; ``Date`` arrives already as ``datetime64[ns]``.
+        """
+        # Year / Month / Day are derived from Date, not read from the file
+        raw_columns = ["Date", *[c for c in FEATURE_COLUMNS if c not in DATE_PARTS], TARGET_COLUMN]
+        column_types = {c: pa.string() if c in CATEGORICAL_COLUMNS else pa.float64() for c in raw_columns}
+        column_types["Date"] = pa.timestamp("ns")
+        # strings_can_be_null: pyarrow otherwise keeps "NA" as a literal string
+        return pa_csv.ConvertOptions(
+            column_types=column_types, include_columns=raw_columns, strings_can_be_null=True
+        )
+
+    # -------------------------------------------------------------------
+    # Helper: _read_csv_fast
+    # -------------------------------------------------------------------
+    def _read_csv_fast(self) -> pd.DataFrame:
+        """
+        Read the CSV with pyarrow's multithreaded parser.
+
+        Returns
+        -------
+        pd.DataFrame
+            NumPy-backed dataframe with text columns as ``object`` and the
+            CSV's null tokens (``NA``, empty fields) as missing values in every
+            column. Unlike ``pd.read_csv``, it holds only the model columns,
+            every numeric column is ``float64``, and ``Date`` is ``datetime64``.
+        """
+        table = pa_csv.read_csv(
+            self.input_path,
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=16 << 20),
+            convert_options=self._arrow_convert_options(),
+        )
+        return table.to_pandas()
+
+    # -------------------------------------------------------------------
+    # Helper: _iter_csv_chunks
+    # -------------------------------------------------------------------
+    def _iter_csv_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Yield the CSV as dataframes of roughly ``self.chunksize`` rows.
+
+        Uses pyarrow's streaming reader (record batches grouped up to
+        ``chunksize`` rows) when available, else ``pd.read_csv(chunksize=...)``.
+        """
+        if pa is None:
+            yield from pd.read_csv(self.input_path, chunksize=self.chunksize)
+            return
+
+        reader = pa_csv.open_csv(
+            self.input_path,
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=16 << 20),
+            convert_options=self._arrow_convert_options(),
+        )
+        batches, n_rows = [], 0
+        for batch in reader:
+            batches.append(batch)
+            n_rows += batch.num_rows
+            if n_rows >= self.chunksize:
+                yield pa.Table.from_batches(batches).to_pandas()
+                batches, n_rows = [], 0
+        if batches:
+            yield pa.Table.from_batches(batches).to_pandas()
+
+    # -------------------------------------------------------------------
+    # Helper: _preprocess_chunk
+    # -------------------------------------------------------------------
+    def _preprocess_chunk(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply the row-local preprocessing steps to a frame or chunk:
+        keep only the model columns and expand ``Date`` ➜ ``Year``, ``Month``,
+        ``Day``. Idempotent, so ``preprocess`` can re-apply it to a frame
+        already reduced while streaming.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Raw (or already reduced) rows.
+
+        Returns
+        -------
+        pd.DataFrame
+            Rows restricted to the feature columns and target.
+        """
+        # Keep only the columns the model uses, so unused ones cannot drop rows later
+        keep = {"Date", TARGET_COLUMN, *FEATURE_COLUMNS}
+        df = df.drop(columns=[c for c in df.columns if c not in keep])
+
+        # Expand Date into Year / Month / Day features and drop the original
+        if "Date" in df.columns:
+            df = df.assign(**self._expand_date(df["Date"])).drop(columns="Date")
+        return df
+
     # -------------------------------------------------------------------
     # Method: preprocess
     # -------------------------------------------------------------------
     def preprocess(self) -> None:
         """
         Perform basic preprocessing:
-        - Identify categorical/numerical columns (for reference)
+        - Keep only ``Date``, the model feature columns, and the target
         - Expand ``Date`` ➜ ``Year``, ``Month``, ``Day``
-        - Mean-impute numeric columns
+          (both via ``_preprocess_chunk``)
+        - Identify categorical/numerical columns by dtype
+        - Mean-impute numeric columns over the whole dataset
         - Drop remaining missing values
 
         Raises
@@ -137,30 +411,24 @@ class DataProcessing:
             if self.df is None:
                 raise ValueError("Dataframe is not loaded. Call `load_data()` first.")
 
-            # Determine categorical and numerical columns (kept for parity with original logic)
-            categorical: List[str] = []
-            numerical: List[str] = []
-            # Iterate over columns and separate by dtype
-            for col in self.df.columns:
-                if self.df[col].dtype == "object":
-                    categorical.append(col)
-                else:
-                    numerical.append(col)
-
-            # Convert Date column to datetime
-            self.df["Date"] = pd.to_datetime(self.df["Date"])
+            # Column projection and Date expansion (no-op if done while streaming)
+            self.df = self._preprocess_chunk(self.df)
 
-            # Expand into Year / Month / Day features
-            self.df["Year"] = self.df["Date"].dt.year
-            self.df["Month"] = self.df["Date"].dt.month
-            self.df["Day"] = self.df["Date"].dt.day
-
-            # Drop the original Date column
-            self.df.drop("Date", axis=1, inplace=True)
+            # Determine categorical and numerical columns by dtype; numerical ones
+            # are the measured readings to impute (Year / Month / Day are derived,
+            # so rows with a missing date are still dropped)
+            categorical: List[str] = self.df.select_dtypes(include=["object"]).columns.tolist()
+            numerical: List[str] = [
+                c for c in self.df.select_dtypes(include=["number"]).columns if c not in DATE_PARTS
+            ]
+            logger.debug("Categorical columns: %s | Numerical columns: %s", categorical, numerical)
 
-            # Mean-impute numeric columns, in place
-            for col in numerical:
-                self.df[col].fillna(self.df[col].mean(), inplace=True)
+            # Mean-impute the measured numeric columns with the parallel kernel,
+            # over a column-contiguous float32 block (the downcast dtype). Always
+            # copy: pandas 3 can return a read-only view the kernel cannot write
+            values = np.array(self.df[numerical].to_numpy(dtype=np.float32), order="F")
+            _fillna_mean(values)
+            self.df[numerical] = values
 
             # Drop any residual missing values
             self.df.dropna(inplace=True)
@@ -174,6 +442,45 @@ class DataProcessing:
             # Re-raise using the project's custom exception (call pattern preserved)
             raise CustomException("Failed to preprocess data", e)
 
+    # -------------------------------------------------------------------
+    # Helper: _expand_date
+    # -------------------------------------------------------------------
+    @staticmethod
+    def _expand_date(dates: pd.Series) -> Dict[str, np.ndarray]:
+        """
+        Derive ``Year``, ``Month`` and ``Day`` columns from a date column.
+
+        Dates are truncated to day, month and year precision in NumPy and the
+        components recovered by subtraction, rather than through three
+        separate ``.dt`` accessor passes.
+
+        Parameters
+        ----------
+        dates : pd.Series
+            Date strings or an already-parsed ``datetime64`` column.
+
+        Returns
+        -------
+        dict of str to np.ndarray
+            ``int32`` arrays keyed by column name; ``float64`` with ``NaN``
+            where a date is missing, so the row is dropped downstream.
+        """
+        # Parsing is a no-op when pyarrow already produced datetime64 values
+        days = pd.to_datetime(dates).to_numpy(dtype="datetime64[D]")
+        months = days.astype("datetime64[M]")
+        years = days.astype("datetime64[Y]")
+
+        parts = {
+            "Year": years.astype(np.int64) + 1970,
+            "Month": (months - years).astype(np.int64) + 1,
+            "Day": (days - months).astype(np.int64) + 1,
+        }
+
+        missing = np.isnat(days)
+        if missing.any():
+            return {k: np.where(missing, np.nan, v) for k, v in parts.items()}
+        return {k: v.astype(np.int32) for k, v in parts.items()}
+
     # -------------------------------------------------------------------
     # Method: label_encode
     # -------------------------------------------------------------------
@@ -183,9 +490,8 @@ class DataProcessing:
 
         Notes
         -----
-        Columns encoded (kept as per original logic):
-        - ``Location``, ``WindGustDir``, ``WindDir9am``, ``WindDir3pm``,
-          ``RainToday``, ``RainTomorrow``
+        Columns encoded:
+        - ``Location``, ``WindDir3pm``, ``RainToday``, ``RainTomorrow``
 
         Raises
         ------
@@ -197,24 +503,19 @@ class DataProcessing:
             if self.df is None:
                 raise ValueError("Dataframe is not loaded. Call `load_data()` first.")
 
-            # Columns to encode (preserved)
-            categorical: List[str] = [
-                "Location",
-                "WindGustDir",
-                "WindDir9am",
-                "WindDir3pm",
-                "RainToday",
-                "RainTomorrow",
-            ]
+            # Convert the whole categorical block at once and replace values with
+            # their category codes (categories are sorted, so codes match
+            # sklearn's LabelEncoder; every vocabulary fits in int8)
+            cats = self.df[CATEGORICAL_COLUMNS].astype("category")
+            self.df[CATEGORICAL_COLUMNS] = cats.apply(lambda s: s.cat.codes).astype("int8")
 
-            # Iterate over categorical columns and apply LabelEncoder
-            for col in categorical:
-                label_encoder = LabelEncoder()
-                self.df[col] = label_encoder.fit_transform(self.df[col])
+            # Record the vocabularies for ``save_categories``
+            self.categories = {col: cats[col].cat.categories.tolist() for col in CATEGORICAL_COLUMNS}
 
-                # Build and log mapping (class → encoded int)
-                label_mapping = dict(zip(label_encoder.classes_, range(len(label_encoder.classes_))))
-                logger.info("Label mapping for %s: %s", col, label_mapping)
+            # Build and log mappings (class → encoded int) only if they will be emitted
+            if logger.isEnabledFor(logging.INFO):
+                for col, categories in self.categories.items():
+                    logger.info("Label mapping for %s: %s", col, dict(zip(categories, range(len(categories)))))
 
             # Log completion
             logger.info("Label encoding completed.")
@@ -225,6 +526,167 @@ class DataProcessing:
             # Re-raise using the project's custom exception (call pattern preserved)
             raise CustomException("Failed to label encode data", e)
 
+    # -------------------------------------------------------------------
+    # Method: downcast
+    # -------------------------------------------------------------------
+    def downcast(self) -> None:
+        """
+        Shrink column dtypes before the split and persistence.
+
+        Notes
+        -----
+        - ``float64`` readings ➜ ``float32`` (XGBoost bins in float32 anyway)
+        - Label-encoded columns and ``Month`` / ``Day`` ➜ ``int8``
+        - ``Year`` ➜ ``int16``
+
+        Raises
+        ------
+        CustomException
+            If a column cannot be cast.
+        """
+        try:
+            # Guard against missing dataframe
+            if self.df is None:
+                raise ValueError("Dataframe is not loaded. Call `load_data()` first.")
+
+            # Target dtype per column (all encodings / calendar parts fit comfortably)
+            dtypes: Dict[str, str] = {c: "float32" for c in self.df.select_dtypes(include=["float64"]).columns}
+            dtypes.update({c: "int8" for c in (*CATEGORICAL_COLUMNS, "Month", "Day")})
+            dtypes["Year"] = "int16"
+
+            self.df = self.df.astype(dtypes)
+
+            # Log completion with the resulting footprint (skip the scan when INFO is off)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Downcast completed. Memory usage: %.1f MiB", self.df.memory_usage().sum() / 2**20)
+        except Exception as e:
+            # Log the error for debugging
+            logger.error("Error while downcasting data: %s", e)
+
+            # Re-raise using the project's custom exception (call pattern preserved)
+            raise CustomException("Failed to downcast data", e)
+
+    # -------------------------------------------------------------------
+    # Method: process_arrow
+    # -------------------------------------------------------------------
+    def process_arrow(self) -> None:
+        """
+        Run load, preprocess, label encoding and downcast as one pyarrow
+        compute pipeline, converting to pandas only once at the end.
+
+        Notes
+        -----
+        - Produces the same ``self.df`` as the pandas steps: means are taken
+          over all rows before residual nulls are dropped, and categories are
+          encoded against their sorted values so codes match ``label_encode``.
+          ``check_arrow_parity`` verifies this (``verify_arrow=True``).
+        - ``dictionary_encode`` is not used because it numbers values in order
+          of first appearance, which would not match the app's encodings.
+
+        Raises
+        ------
+        CustomException
+            If the CSV cannot be read or processed.
+        """
+        try:
+            # Read only the model columns, with explicit types
+            table = pa_csv.read_csv(
+                self.input_path,
+                read_options=pa_csv.ReadOptions(use_threads=True, block_size=16 << 20),
+                convert_options=self._arrow_convert_options(),
+            )
+            logger.info("Data loaded successfully. Shape: %s", table.shape)
+
+            # Expand Date ➜ Year / Month / Day (null dates stay null and drop below)
+            dates = table["Date"]
+            table = table.drop_columns(["Date"])
+            table = table.append_column("Year", pc.cast(pc.year(dates), pa.int16()))
+            table = table.append_column("Month", pc.cast(pc.month(dates), pa.int8()))
+            table = table.append_column("Day", pc.cast(pc.day(dates), pa.int8()))
+
+            # Mean-impute the measured numeric columns, then narrow to float32
+            for name in table.column_names:
+                if name in CATEGORICAL_COLUMNS or name in DATE_PARTS:
+                    continue
+                col = table[name]
+                filled = pc.fill_null(col, pc.mean(col))
+                table = table.set_column(table.schema.get_field_index(name), name, pc.cast(filled, pa.float32()))
+
+            # Drop any residual missing values
+            table = table.drop_null()
+
+            # Encode categoricals as int8 positions in their sorted vocabulary
+            for name in CATEGORICAL_COLUMNS:
+                col = table[name]
+                categories = pc.unique(col)
+                categories = categories.take(pc.array_sort_indices(categories))
+                codes = pc.cast(pc.index_in(col, value_set=categories), pa.int8())
+                table = table.set_column(table.schema.get_field_index(name), name, codes)
+                self.categories[name] = categories.to_pylist()
+
+                # Build and log mapping (class → encoded int) only if it will be emitted
+                if logger.isEnabledFor(logging.INFO):
+                    label_mapping = dict(zip(self.categories[name], range(len(categories))))
+                    logger.info("Label mapping for %s: %s", name, label_mapping)
+
+            # Single conversion to a NumPy-backed dataframe
+            self.df = table.to_pandas()
+
+            # Log completion
+            logger.info("Arrow data processing completed. Shape: %s", self.df.shape)
+        except Exception as e:
+            # Log the error for debugging
+            logger.error("Error while processing data with pyarrow: %s", e)
+
+            # Re-raise using the project's custom exception (call pattern preserved)
+            raise CustomException("Failed to process data with pyarrow", e)
+
+    # -------------------------------------------------------------------
+    # Method: check_arrow_parity
+    # -------------------------------------------------------------------
+    def check_arrow_parity(self) -> None:
+        """
+        Check that ``process_arrow`` produced exactly what the pandas steps do.
+
+        Re-runs ``load_data``, ``preprocess``, ``label_encode`` and ``downcast``
+        on the same input and compares the result with the current
+        ``self.df`` (values, dtypes and column order; the index is ignored)
+        and ``self.categories``. Both are left as the Arrow result.
+
+        Raises
+        ------
+        CustomException
+            If the frames differ or the check cannot run.
+        """
+        try:
+            # Guard against missing dataframe
+            if self.df is None:
+                raise ValueError("Dataframe is not loaded. Call `process_arrow()` first.")
+            arrow_df, arrow_categories = self.df, self.categories
+
+            # Reference frame from the pandas steps
+            self.load_data()
+            self.preprocess()
+            self.label_encode()
+            self.downcast()
+            pandas_df, self.df = self.df, arrow_df
+            pandas_categories, self.categories = self.categories, arrow_categories
+
+            pd.testing.assert_frame_equal(
+                arrow_df.reset_index(drop=True), pandas_df.reset_index(drop=True), check_exact=True
+            )
+            if arrow_categories != pandas_categories:
+                raise ValueError("Category vocabularies differ between the Arrow and pandas steps.")
+
+            # Log completion
+            logger.info("Arrow pipeline matches the pandas steps on %d rows.", len(arrow_df))
+        except Exception as e:
+            # Log the error for debugging
+            logger.error("Error while checking Arrow parity: %s", e)
+
+            # Re-raise using the project's custom exception (call pattern preserved)
+            raise CustomException("Arrow pipeline does not match the pandas steps", e)
+
     # -------------------------------------------------------------------
     # Method: split_data
     # -------------------------------------------------------------------
@@ -234,8 +696,11 @@ class DataProcessing:
 
         Notes
         -----
-        - Features: all columns except ``RainTomorrow``
+        - Features: ``FEATURE_COLUMNS`` (in that order)
         - Target: ``RainTomorrow``
+        - 80/20 split of a seeded (``default_rng(42)``) row permutation
+        - Written as one ``processed.parquet`` tagged by ``_split``, with the
+          train and test rows in separate row groups
 
         Raises
         ------
@@ -247,23 +712,28 @@ class DataProcessing:
             if self.df is None:
                 raise ValueError("Dataframe is not loaded. Call `load_data()` first.")
 
-            # Features (drop target column)
-            X: pd.DataFrame = self.df.drop("RainTomorrow", axis=1)
-
-            # Target (binary-encoded by previous step)
-            Y: pd.Series = self.df["RainTomorrow"]
-
             # Log feature columns for traceability
-            logger.info("Feature columns: %s", list(X.columns))
-
-            # Perform the train/test split with a fixed seed for reproducibility
-            X_train, X_test, y_train, y_test = train_test_split(X, Y, test_size=0.2, random_state=42)
-
-            # Persist splits to the processed artefacts directory
-            joblib.dump(X_train, os.path.join(self.output_path, "X_train.pkl"))
-            joblib.dump(X_test, os.path.join(self.output_path, "X_test.pkl"))
-            joblib.dump(y_train, os.path.join(self.output_path, "y_train.pkl"))
-            joblib.dump(y_test, os.path.join(self.output_path, "y_test.pkl"))
+            logger.info("Feature columns: %s", FEATURE_COLUMNS)
+
+            # Shuffle row positions with a fixed seed and hold out the last 20%
+            n_rows = len(self.df)
+            order = np.random.default_rng(42).permutation(n_rows)
+            cut = int(0.8 * n_rows)
+
+            # Gather features (fixed training order) and target for the shuffled
+            # rows in a single take, train rows first
+            positions = self.df.columns.get_indexer([*FEATURE_COLUMNS, TARGET_COLUMN])
+            out = self.df.iloc[order, positions].reset_index(drop=True)
+            out[SPLIT_COLUMN] = (np.arange(n_rows) >= cut).astype(np.uint8)
+
+            # One columnar (zstd) file for both splits, one row group per split
+            # so readers can skip the other via row-group statistics
+            table = pa.Table.from_pandas(out, preserve_index=False)
+            with pq.ParquetWriter(
+                os.path.join(self.output_path, PROCESSED_FILE), table.schema, compression="zstd"
+            ) as writer:
+                writer.write_table(table.slice(0, cut))
+                writer.write_table(table.slice(cut))
 
             # Log successful file saves
             logger.info("Data split and persistence completed successfully.")
@@ -274,6 +744,77 @@ class DataProcessing:
             # Re-raise using the project's custom exception (call pattern preserved)
             raise CustomException("Failed to split data", e)
 
+    # -------------------------------------------------------------------
+    # Method: save_categories
+    # -------------------------------------------------------------------
+    def save_categories(self) -> None:
+        """
+        Persist the label-encoding vocabularies to ``categories.json``.
+
+        The file maps each of ``CATEGORICAL_COLUMNS`` to its sorted
+        categories, so a value's code is its list position. ``app.py`` builds
+        its location and wind-direction encoders from it, keeping serving in
+        step with the codes the model was trained on.
+
+        Raises
+        ------
+        CustomException
+            If label encoding has not run or the file cannot be written.
+        """
+        try:
+            # Guard against missing vocabularies
+            if not self.categories:
+                raise ValueError("No categories recorded. Call `label_encode()` first.")
+
+            categories_path = os.path.join(self.output_path, CATEGORIES_FILE)
+            with open(categories_path, "w", encoding="utf-8") as f:
+                json.dump(self.categories, f, indent=2)
+
+            # Log successful file save
+            logger.info("Category vocabularies saved at %s", categories_path)
+        except Exception as e:
+            # Log the error for debugging
+            logger.error("Error while saving categories: %s", e)
+
+            # Re-raise using the project's custom exception (call pattern preserved)
+            raise CustomException("Failed to save categories", e)
+
+    # -------------------------------------------------------------------
+    # Helper: _input_fingerprint
+    # -------------------------------------------------------------------
+    def _input_fingerprint(self) -> str:
+        """
+        Cheap fingerprint of the input CSV and the processing layout.
+
+        Hashes the file's size and modification time (a ``stat``, not a read),
+        plus the feature columns and target, so changing either the data or
+        the feature set invalidates the cached artefact.
+        """
+        stat = os.stat(self.input_path)
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        h.update(json.dumps([FEATURE_COLUMNS, TARGET_COLUMN]).encode())
+        return h.hexdigest()
+
+    # -------------------------------------------------------------------
+    # Helper: _is_up_to_date
+    # -------------------------------------------------------------------
+    def _is_up_to_date(self, fingerprint: str) -> bool:
+        """
+        Return ``True`` if the manifest matches ``fingerprint`` and the
+        processed artefacts it describes exist.
+        """
+        manifest_path = os.path.join(self.output_path, MANIFEST_FILE)
+        for artefact in (PROCESSED_FILE, CATEGORIES_FILE):
+            if not os.path.exists(os.path.join(self.output_path, artefact)):
+                return False
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return False
+        return manifest.get("input_fingerprint") == fingerprint
+
     # -------------------------------------------------------------------
     # Method: run
     # -------------------------------------------------------------------
@@ -283,20 +824,60 @@ class DataProcessing:
         1) Load data
         2) Preprocess (datetime expansion, imputation, drop NA)
         3) Label encode selected categorical columns
-        4) Split and persist datasets
+        4) Downcast dtypes (float32 / int8 / int16)
+        5) Split and persist datasets
+        6) Persist the category vocabularies
+
+        Steps 1–4 run as a single pyarrow pipeline (``process_arrow``) when
+        pyarrow is installed and the CSV is not being streamed in chunks;
+        with ``verify_arrow`` set, the result is then checked against the
+        pandas steps.
+
+        All steps are skipped when ``_manifest.json`` records the current input
+        fingerprint and ``processed.parquet`` exists.
         """
-        # Load the CSV
-        self.load_data()
+        # Skip the whole stage if the artefact was built from this exact input
+        fingerprint = self._input_fingerprint()
+        if self._is_up_to_date(fingerprint):
+            logger.info("Processed data is up to date (cache hit); skipping data processing.")
+            return
+
+        # Invalidate any previous manifest until the new artefact is complete
+        manifest_path = os.path.join(self.output_path, MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
 
-        # Apply preprocessing steps
-        self.preprocess()
+        if pa is not None and not self.chunksize:
+            # Load, preprocess, encode and downcast in Arrow
+            self.process_arrow()
 
-        # Encode categorical columns
-        self.label_encode()
+            # Optionally confirm the Arrow result matches the pandas steps
+            if self.verify_arrow:
+                self.check_arrow_parity()
+        else:
+            # Load the CSV
+            self.load_data()
+
+            # Apply preprocessing steps
+            self.preprocess()
+
+            # Encode categorical columns
+            self.label_encode()
+
+            # Shrink dtypes before the split copies the frame
+            self.downcast()
 
         # Split into train/test and save artefacts
         self.split_data()
 
+        # Save the encodings the app must reproduce
+        self.save_categories()
+
+        # Record the input the artefact was built from (written last, so a failed
+        # run never leaves a matching manifest behind)
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump({"input_fingerprint": fingerprint, "artefact": PROCESSED_FILE}, f, indent=2)
+
         # Log completion
         logger.info("Data processing completed.")
 
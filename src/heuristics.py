@@ -0,0 +1,165 @@
+"""
+heuristics.py
+=============
+Numeric feature-inference kernels for the Weather Prediction web app.
+
+Overview
+--------
+The Flask app only asks users for a handful of observations and infers the
+remaining model features with simple, season-aware heuristics. This module
+holds the pure-numeric part of that inference, compiled with Numba so the
+per-request arithmetic runs as native code instead of interpreted bytecode.
+
+Notes
+-----
+- Parsing, validation, and categorical lookups stay in ``app.py``; only
+  numbers go in and out of the kernels here.
+- Month-dependent values come from module-level lookup tables, which Numba
+  freezes into the compiled code as constants.
+- ``build_features`` applies the same rules to many rows for the batch
+  prediction endpoint, in parallel with ``prange``. The thread count follows
+  ``NUMBA_NUM_THREADS``, which ``app.py`` defaults to 1 so gunicorn workers
+  do not each spawn a thread per host core.
+- Kernels are compiled with ``cache=True`` and warmed at import so the first
+  request does not pay the JIT compile cost.
+
+Examples
+--------
+>>> from src.heuristics import compute_heuristics
+>>> sunshine, cloud3pm, *_ = compute_heuristics(13.0, 23.0, 55, 0.0, 1)
+>>> sunshine, cloud3pm
+(9.0, 4)
+"""
+
+from __future__ import annotations
+
+# -------------------------------------------------------------------
+# Third-party imports
+# -------------------------------------------------------------------
+import numpy as np
+from numba import njit, prange
+
+
+# -------------------------------------------------------------------
+# Lookup tables
+# -------------------------------------------------------------------
+# Typical sunshine hours indexed by ``month - 1`` (southern-hemisphere seasons:
+# summer 9.0, autumn 7.0, winter 5.0, spring 8.0)
+SEASON_SUNSHINE: np.ndarray = np.array(
+    [9.0, 9.0, 7.0, 7.0, 7.0, 5.0, 5.0, 5.0, 8.0, 8.0, 8.0, 9.0], dtype=np.float64
+)
+
+
+# -------------------------------------------------------------------
+# Kernel: single-row heuristics
+# -------------------------------------------------------------------
+@njit(cache=True, fastmath=True)
+def compute_heuristics(min_temp, max_temp, hum_3pm, rainfall, month):
+    """
+    Infer the numeric model features derived from the minimal user inputs.
+
+    Parameters
+    ----------
+    min_temp, max_temp : float
+        Daily minimum/maximum temperature (°C).
+    hum_3pm : int
+        Relative humidity at 3pm (%).
+    rainfall : float
+        Rainfall today (mm).
+    month : int
+        Calendar month (1–12).
+
+    Returns
+    -------
+    tuple
+        ``(sunshine, cloud3pm, pressure3pm, evaporation, rain_today)`` with
+        ``rain_today`` already encoded as 0/1.
+    """
+    # Sunshine hours by season (month-indexed table)
+    sunshine = SEASON_SUNSHINE[month - 1]
+
+    # Cloud (oktas 0–8) from humidity
+    cloud3pm = max(0, min(8, int(round((hum_3pm / 100.0) * 8))))
+
+    # Pressure heuristic (hPa): base 1015 − small humidity adjustment
+    pressure3pm = round(1015.0 - 0.08 * (hum_3pm - 50), 1)
+
+    # Evaporation: function of sunshine & diurnal range (empirical)
+    evaporation = max(0.0, 0.12 * sunshine + 0.03 * (max_temp - min_temp))
+
+    # RainToday derived from rainfall threshold (No=0, Yes=1)
+    rain_today = 1 if rainfall > 0.2 else 0
+
+    return sunshine, cloud3pm, pressure3pm, evaporation, rain_today
+
+
+# -------------------------------------------------------------------
+# Kernel: batch feature matrix
+# -------------------------------------------------------------------
+# Column order written by ``build_features`` (must match ``FEATURE_ORDER``
+# in ``app.py``)
+BATCH_FEATURE_ORDER = (
+    "Location", "MinTemp", "MaxTemp", "Rainfall", "Evaporation",
+    "Sunshine", "WindDir3pm", "WindSpeed3pm", "Humidity3pm", "Pressure3pm",
+    "Cloud3pm", "RainToday", "Year", "Month", "Day",
+)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def build_features(min_temp, max_temp, hum_3pm, spd_3pm, rainfall,
+                   year, month, day, loc_enc, prevailing_enc, out):
+    """
+    Fill a batch feature matrix in place, one row per prediction.
+
+    Rows are processed in parallel with ``prange``; each row applies the
+    same rules as ``compute_heuristics``.
+
+    Parameters
+    ----------
+    min_temp, max_temp, hum_3pm, spd_3pm, rainfall : np.ndarray
+        ``float64`` arrays of shape ``(n,)``; humidity and wind speed already
+        reduced to whole numbers.
+    year, month, day : np.ndarray
+        ``int64`` calendar arrays of shape ``(n,)``.
+    loc_enc : np.ndarray
+        ``int32`` encoded locations, shape ``(n,)``.
+    prevailing_enc : np.ndarray
+        ``int8`` encoded prevailing wind direction per location id.
+    out : np.ndarray
+        Preallocated ``float32`` matrix of shape ``(n, 15)`` in
+        ``BATCH_FEATURE_ORDER``.
+    """
+    for i in prange(min_temp.shape[0]):
+        sunshine = SEASON_SUNSHINE[month[i] - 1]
+        hum = hum_3pm[i]
+
+        out[i, 0] = loc_enc[i]
+        out[i, 1] = min_temp[i]
+        out[i, 2] = max_temp[i]
+        out[i, 3] = rainfall[i]
+        out[i, 4] = max(0.0, 0.12 * sunshine + 0.03 * (max_temp[i] - min_temp[i]))
+        out[i, 5] = sunshine
+        out[i, 6] = prevailing_enc[loc_enc[i]]
+        out[i, 7] = spd_3pm[i]
+        out[i, 8] = hum
+        out[i, 9] = round(1015.0 - 0.08 * (hum - 50), 1)
+        out[i, 10] = max(0.0, min(8.0, np.rint((hum / 100.0) * 8)))
+        out[i, 11] = 1.0 if rainfall[i] > 0.2 else 0.0
+        out[i, 12] = year[i]
+        out[i, 13] = month[i]
+        out[i, 14] = day[i]
+
+
+# -------------------------------------------------------------------
+# JIT warm-up (argument types match the app's parsed inputs)
+# -------------------------------------------------------------------
+compute_heuristics(13.0, 23.0, 55, 0.0, 1)
+
+_f = np.ones(1, dtype=np.float64)
+_i = np.ones(1, dtype=np.int64)
+build_features(
+    _f, _f, _f, _f, _f, _i, _i, _i,
+    np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.int8),
+    np.empty((1, len(BATCH_FEATURE_ORDER)), dtype=np.float32),
+)
+del _f, _i
@@ -23,30 +23,130 @@ Example:
 
 Notes
 -----
-- Logs are written to `logs/log_YYYY-MM-DD.log` (UTF-8 encoded)
+- Logs are written to `logs/log_YYYY-MM-DD.log` (UTF-8 encoded); the
+  directory is created on first use and the file rolls over at midnight.
 - Each message includes a timestamp and severity level.
 - Default level: INFO
 - Console and file outputs both support Unicode characters.
+- Loggers only enqueue records; a single background ``QueueListener``
+  thread performs the file and console writes, and is stopped (flushing
+  any queued records) at interpreter exit.
 """
 
 # -------------------------------------------------------------------
 # Standard Library Imports
 # -------------------------------------------------------------------
+import atexit
 import logging
 import os
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
 
 # -------------------------------------------------------------------
-# Directory Setup
+# Log File Configuration
 # -------------------------------------------------------------------
 LOGS_DIR = "logs"
-os.makedirs(LOGS_DIR, exist_ok=True)
+
+# Log file path per date, memoised so the directory is created only once
+_LOG_PATHS: Dict[str, str] = {}
+
+
+def _log_path(today: str) -> str:
+    """
+    Return the log file path for ``today`` (``YYYY-MM-DD``), creating
+    ``LOGS_DIR`` on first use.
+    """
+    path = _LOG_PATHS.get(today)
+    if path is None:
+        os.makedirs(LOGS_DIR, exist_ok=True)
+        path = _LOG_PATHS[today] = os.path.join(LOGS_DIR, f"log_{today}.log")
+    return path
+
 
 # -------------------------------------------------------------------
-# Log File Configuration
+# Daily File Handler
 # -------------------------------------------------------------------
-LOG_FILE = os.path.join(LOGS_DIR, f"log_{datetime.now().strftime('%Y-%m-%d')}.log")
+class _DailyFileHandler(logging.FileHandler):
+    """
+    UTF-8 file handler that switches to a new ``log_YYYY-MM-DD.log`` when
+    the date changes, so long-running processes do not write to a stale file.
+    """
+
+    def __init__(self) -> None:
+        self._today = datetime.now().strftime("%Y-%m-%d")
+        # Delay opening until the first record is written
+        super().__init__(_log_path(self._today), encoding="utf-8", delay=True)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        today = datetime.now().strftime("%Y-%m-%d")
+        if today != self._today:
+            # Close the previous day's file; the next write reopens at the new path
+            self.close()
+            self._today = today
+            self.baseFilename = os.path.abspath(_log_path(today))
+        super().emit(record)
+
+# -------------------------------------------------------------------
+# Shared Record Queue
+# -------------------------------------------------------------------
+# Every logger enqueues onto one unbounded queue drained by one listener
+_LOG_QUEUE: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_LISTENER: Optional[QueueListener] = None
+
+
+# -------------------------------------------------------------------
+# Listener Setup
+# -------------------------------------------------------------------
+def _start_listener() -> QueueListener:
+    """
+    Create the file and console handlers and start the background listener
+    that writes queued records to them (once per process).
+
+    Returns
+    -------
+    QueueListener
+        The running listener, also stored in ``_LISTENER``.
+    """
+    global _LISTENER
+    if _LISTENER is not None:
+        return _LISTENER
+
+    # -------------------------------------------------------------------
+    # File Handler (UTF-8)
+    # -------------------------------------------------------------------
+    file_handler = _DailyFileHandler()
+    file_handler.setLevel(logging.INFO)
+
+    # -------------------------------------------------------------------
+    # Console Handler (UTF-8)
+    # -------------------------------------------------------------------
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+
+    # Ensure stdout stream is UTF-8 encoded (Python 3.9+)
+    if hasattr(console_handler.stream, "reconfigure"):
+        console_handler.stream.reconfigure(encoding="utf-8")
+
+    # -------------------------------------------------------------------
+    # Formatter
+    # -------------------------------------------------------------------
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+    file_handler.setFormatter(formatter)
+    console_handler.setFormatter(formatter)
+
+    # -------------------------------------------------------------------
+    # Start Listener (stopped, and drained, at exit)
+    # -------------------------------------------------------------------
+    _LISTENER = QueueListener(_LOG_QUEUE, file_handler, console_handler, respect_handler_level=True)
+    _LISTENER.start()
+    atexit.register(_LISTENER.stop)
+
+    return _LISTENER
+
 
 # -------------------------------------------------------------------
 # Logger Factory Function
@@ -54,7 +154,7 @@ LOG_FILE = os.path.join(LOGS_DIR, f"log_{datetime.now().strftime('%Y-%m-%d')}.lo
 def get_logger(name: str) -> logging.Logger:
     """
     Returns a configured logger instance with UTF-8 support for both
-    console and file output.
+    console and file output, written asynchronously by a shared listener.
 
     Parameters
     ----------
@@ -71,34 +171,9 @@ def get_logger(name: str) -> logging.Logger:
 
     # Prevent adding duplicate handlers if re-imported
     if not logger.handlers:
-        # -------------------------------------------------------------------
-        # File Handler (UTF-8)
-        # -------------------------------------------------------------------
-        file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
-        file_handler.setLevel(logging.INFO)
-
-        # -------------------------------------------------------------------
-        # Console Handler (UTF-8)
-        # -------------------------------------------------------------------
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-
-        # Ensure stdout stream is UTF-8 encoded (Python 3.9+)
-        if hasattr(console_handler.stream, "reconfigure"):
-            console_handler.stream.reconfigure(encoding="utf-8")
-
-        # -------------------------------------------------------------------
-        # Formatter
-        # -------------------------------------------------------------------
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
-
-        # -------------------------------------------------------------------
-        # Attach Handlers
-        # -------------------------------------------------------------------
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
-
-    return logger
\ No newline at end of file
+        # Ensure the background writer is running, then attach a
+        # non-blocking handler that only enqueues records
+        _start_listener()
+        logger.addHandler(QueueHandler(_LOG_QUEUE))
+
+    return logger
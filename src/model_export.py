@@ -0,0 +1,255 @@
+"""
+model_export.py
+===============
+Implements the ``ModelExport`` class for the Weather Prediction workflow.
+
+Overview
+--------
+This module converts the trained XGBoost model into an ONNX graph so the Flask
+app can serve it through ONNX Runtime instead of the Python XGBoost wrapper.
+It:
+1) Loads the trained booster artefact (``model.json``)
+2) Converts it to ONNX with ``onnxmltools``
+3) Validates ONNX predictions against the original model on the test split
+4) Persists the graph to ``artifacts/models/model.onnx``
+
+Notes
+-----
+- Validation compares labels on the test split of ``processed.parquet`` and
+  fails the export if any prediction differs (e.g. from an ``n_estimators`` /
+  best-iteration mismatch).
+- Saved artefacts:
+  * ``model.onnx`` — ONNX graph consumed by ``app.py``.
+
+Examples
+--------
+>>> exporter = ModelExport("artifacts/models", "artifacts/processed")
+>>> exporter.run()
+"""
+
+from __future__ import annotations
+
+# -------------------------------------------------------------------
+# Standard & third-party imports
+# -------------------------------------------------------------------
+import os
+
+import numpy as np
+import onnx
+import onnxruntime as ort
+import xgboost as xgb
+from onnxmltools import convert_xgboost
+from onnxmltools.convert.common.data_types import FloatTensorType
+
+# -------------------------------------------------------------------
+# Internal imports
+# -------------------------------------------------------------------
+from src.logger import get_logger
+from src.custom_exception import CustomException
+from src.data_processing import load_split
+
+# -------------------------------------------------------------------
+# Logger setup
+# -------------------------------------------------------------------
+logger = get_logger(__name__)
+
+
+# -------------------------------------------------------------------
+# Class: ModelExport
+# -------------------------------------------------------------------
+class ModelExport:
+    """
+    Convert the trained XGBoost model to ONNX and validate parity.
+
+    Parameters
+    ----------
+    model_dir : str
+        Directory containing ``model.json`` and receiving ``model.onnx``
+        (e.g., ``artifacts/models``).
+    data_dir : str
+        Directory containing the processed test split used for validation
+        (e.g., ``artifacts/processed``).
+
+    Attributes
+    ----------
+    model_dir : str
+        Directory for model artefacts.
+    data_dir : str
+        Directory for processed data artefacts.
+    model : xgb.Booster | None
+        Trained booster loaded from disk.
+    onnx_model : onnx.ModelProto | None
+        Converted ONNX graph.
+    X_val, y_ref : np.ndarray | None
+        Validation features and reference XGBoost labels.
+    """
+
+    def __init__(self, model_dir: str, data_dir: str) -> None:
+        # Paths for the model artefacts and validation data
+        self.model_dir: str = model_dir
+        self.data_dir: str = data_dir
+
+        # Placeholders for the source model and converted graph
+        self.model = None
+        self.onnx_model = None
+
+        # Placeholders for validation data and reference predictions
+        self.X_val = None
+        self.y_ref = None
+
+        # Log initialisation
+        logger.info("Model Export initialised.")
+
+    # -------------------------------------------------------------------
+    # Method: load_model
+    # -------------------------------------------------------------------
+    def load_model(self) -> None:
+        """
+        Load the trained booster from ``model.json``.
+
+        Raises
+        ------
+        CustomException
+            If the model artefact cannot be loaded.
+        """
+        try:
+            model_path = os.path.join(self.model_dir, "model.json")
+            self.model = xgb.Booster()
+            self.model.load_model(model_path)
+
+            # The ONNX converter only understands positional ``f<i>`` feature names,
+            # and validation feeds plain arrays; drop the training column names
+            # (feature order is unchanged)
+            self.model.feature_names = None
+            self.model.feature_types = None
+            logger.info("Model loaded from %s", model_path)
+        except Exception as e:
+            logger.error("Error while loading model: %s", e)
+            raise CustomException("Failed to load model", e)
+
+    # -------------------------------------------------------------------
+    # Method: convert
+    # -------------------------------------------------------------------
+    def convert(self) -> None:
+        """
+        Convert the loaded model to ONNX.
+
+        Raises
+        ------
+        CustomException
+            If the conversion fails.
+        """
+        try:
+            # Single dynamic batch dimension, one float column per training feature
+            n_features = int(self.model.num_features())
+            initial_types = [("input", FloatTensorType([None, n_features]))]
+            self.onnx_model = convert_xgboost(self.model, initial_types=initial_types)
+
+            logger.info("Model converted to ONNX with %d input features.", n_features)
+        except Exception as e:
+            logger.error("Error while converting model: %s", e)
+            raise CustomException("Failed to convert model", e)
+
+    # -------------------------------------------------------------------
+    # Method: validate
+    # -------------------------------------------------------------------
+    def validate(self) -> None:
+        """
+        Compare ONNX Runtime predictions with the original model on the test split.
+
+        Raises
+        ------
+        CustomException
+            If any prediction differs or validation cannot run.
+        """
+        try:
+            X_test = load_split(self.data_dir, "X_test")
+            self.X_val = np.asarray(X_test, dtype=np.float32)
+
+            # Reference labels from the original booster (probabilities ➜ 0/1)
+            self.y_ref = (self.model.predict(xgb.DMatrix(self.X_val)) > 0.5).astype(np.int64)
+
+            # Predictions from the converted graph must match exactly
+            mismatches = self._count_mismatches(self.onnx_model.SerializeToString())
+            if mismatches:
+                raise ValueError(f"{mismatches} of {len(self.y_ref)} predictions differ from XGBoost.")
+
+            logger.info("ONNX parity check passed on %d rows.", len(self.y_ref))
+        except Exception as e:
+            logger.error("Error while validating ONNX model: %s", e)
+            raise CustomException("Failed to validate ONNX model", e)
+
+    # -------------------------------------------------------------------
+    # Helper: _count_mismatches
+    # -------------------------------------------------------------------
+    def _count_mismatches(self, model_source) -> int:
+        """
+        Count validation rows where an ONNX graph disagrees with XGBoost.
+
+        Parameters
+        ----------
+        model_source : bytes | str
+            Serialised graph or path to an ``.onnx`` file.
+        """
+        sess = ort.InferenceSession(model_source, providers=["CPUExecutionProvider"])
+        input_name = sess.get_inputs()[0].name
+        label_name = sess.get_outputs()[0].name
+        actual = sess.run([label_name], {input_name: self.X_val})[0].astype(np.int64)
+        return int(np.count_nonzero(self.y_ref != actual))
+
+    # -------------------------------------------------------------------
+    # Method: save_model
+    # -------------------------------------------------------------------
+    def save_model(self) -> None:
+        """
+        Persist the ONNX graph to ``model.onnx``.
+
+        Raises
+        ------
+        CustomException
+            If the graph cannot be written.
+        """
+        try:
+            onnx_path = os.path.join(self.model_dir, "model.onnx")
+            onnx.save_model(self.onnx_model, onnx_path)
+            logger.info("ONNX model saved at %s", onnx_path)
+        except Exception as e:
+            logger.error("Error while saving ONNX model: %s", e)
+            raise CustomException("Failed to save ONNX model", e)
+
+    # -------------------------------------------------------------------
+    # Method: run
+    # -------------------------------------------------------------------
+    def run(self) -> None:
+        """
+        Execute the export workflow:
+        1) Load model
+        2) Convert to ONNX
+        3) Validate parity
+        4) Save graph
+        """
+        # Load the trained model
+        self.load_model()
+
+        # Convert to ONNX
+        self.convert()
+
+        # Check predictions match the original model
+        self.validate()
+
+        # Persist the ONNX graph
+        self.save_model()
+
+        # Final log message
+        logger.info("Model export completed successfully.")
+
+
+# -------------------------------------------------------------------
+# Script entrypoint
+# -------------------------------------------------------------------
+if __name__ == "__main__":
+    # Default model/data paths
+    exporter = ModelExport("artifacts/models", "artifacts/processed")
+
+    # Execute full export workflow
+    exporter.run()
@@ -7,17 +7,19 @@ Overview
 --------
 This module defines the training and evaluation stage of the MLOps Weather Prediction pipeline.
 It:
-1) Loads preprocessed data artefacts (``X_train.pkl``, ``y_train.pkl`` etc.)
+1) Loads preprocessed data artefacts (train/test splits of ``processed.parquet``)
 2) Trains an XGBoost classifier
 3) Evaluates model performance using multiple metrics
 4) Persists the trained model for later inference and deployment
 
 Notes
 -----
-- The model is trained using ``XGBClassifier`` from the XGBoost library.
+- The model is trained with XGBoost's native ``xgb.train`` API on a
+  ``QuantileDMatrix``, using the ``hist`` tree method (256 bins) and one
+  thread per CPU core; parameters mirror ``XGBClassifier``'s defaults.
 - Evaluation metrics include Accuracy, Precision, Recall, and F1-score.
 - Saved artefacts:
-  * ``model.pkl`` — serialised model object for reuse in later stages.
+  * ``model.json`` — serialised booster for reuse in later stages.
 
 Examples
 --------
@@ -31,15 +33,15 @@ from __future__ import annotations
 # Standard & third-party imports
 # -------------------------------------------------------------------
 import os
-import joblib
 import xgboost as xgb
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+from sklearn.metrics import accuracy_score, precision_recall_fscore_support
 
 # -------------------------------------------------------------------
 # Internal imports
 # -------------------------------------------------------------------
 from src.logger import get_logger
 from src.custom_exception import CustomException
+from src.data_processing import load_split
 
 # -------------------------------------------------------------------
 # Logger setup
@@ -62,6 +64,11 @@ class ModelTraining:
     output_path : str
         Directory where the trained model will be saved.
         (e.g., ``artifacts/models``)
+    device : str, default="cpu"
+        XGBoost device for histogram construction (``"cpu"`` or ``"cuda"``).
+    debug_eval : bool, default=False
+        Also score the training set in ``eval_model`` (an extra full
+        inference pass over the larger split).
 
     Attributes
     ----------
@@ -69,19 +76,45 @@ class ModelTraining:
         Directory for input artefacts.
     output_path : str
         Directory for output model artefacts.
-    model : xgb.XGBClassifier
-        Instance of the XGBoost classifier.
-    X_train, X_test, y_train, y_test : pd.DataFrame | None
-        Training and testing splits loaded from disk.
+    params : dict
+        Booster training parameters (binary logistic objective).
+    num_boost_round : int
+        Number of boosting rounds.
+    model : xgb.Booster | None
+        Trained booster.
+    dtrain : xgb.QuantileDMatrix | None
+        Pre-binned training matrix, reused for the optional training-set score.
+    X_train, X_test : pd.DataFrame | None
+        Training and testing feature matrices loaded from disk.
+    y_train, y_test : np.ndarray | None
+        Training and testing targets (``int8`` arrays decoded from
+        ``processed.parquet``).
     """
 
-    def __init__(self, input_path: str, output_path: str) -> None:
+    def __init__(
+        self, input_path: str, output_path: str, device: str = "cpu", debug_eval: bool = False
+    ) -> None:
         # Paths for loading data and saving models
         self.input_path: str = input_path
         self.output_path: str = output_path
 
-        # Initialise XGBoost classifier
-        self.model: xgb.XGBClassifier = xgb.XGBClassifier()
+        # Whether to pay for a training-set inference pass during evaluation
+        self.debug_eval: bool = debug_eval
+
+        # Booster parameters: XGBClassifier's defaults, with histogram split
+        # finding on all cores (``max_bin`` must match the QuantileDMatrix)
+        self.params: dict = {
+            "objective": "binary:logistic",
+            "tree_method": "hist",
+            "max_bin": 256,
+            "nthread": os.cpu_count(),
+            "device": device,
+        }
+        self.num_boost_round: int = 100
+
+        # Placeholders for the trained booster and its training matrix
+        self.model = None
+        self.dtrain = None
 
         # Placeholders for datasets
         self.X_train = None
@@ -108,11 +141,11 @@ class ModelTraining:
             If any artefact file cannot be loaded.
         """
         try:
-            # Load feature and label datasets
-            self.X_train = joblib.load(os.path.join(self.input_path, "X_train.pkl"))
-            self.X_test = joblib.load(os.path.join(self.input_path, "X_test.pkl"))
-            self.y_train = joblib.load(os.path.join(self.input_path, "y_train.pkl"))
-            self.y_test = joblib.load(os.path.join(self.input_path, "y_test.pkl"))
+            # Load feature and label datasets (Parquet, or legacy .pkl)
+            self.X_train = load_split(self.input_path, "X_train")
+            self.X_test = load_split(self.input_path, "X_test")
+            self.y_train = load_split(self.input_path, "y_train")
+            self.y_test = load_split(self.input_path, "y_test")
 
             # Log success
             logger.info("Preprocessed data loaded successfully.")
@@ -126,7 +159,7 @@ class ModelTraining:
     # -------------------------------------------------------------------
     def train_model(self) -> None:
         """
-        Train the XGBoost classifier and persist the model to disk.
+        Train the XGBoost booster and persist the model to disk.
 
         Raises
         ------
@@ -134,12 +167,15 @@ class ModelTraining:
             If training or persistence fails.
         """
         try:
-            # Fit model to training data
-            self.model.fit(self.X_train, self.y_train)
+            # Bin features straight into a quantised matrix (no float copy)
+            self.dtrain = xgb.QuantileDMatrix(self.X_train, label=self.y_train, max_bin=self.params["max_bin"])
+
+            # Train with the native API, bypassing the sklearn wrapper
+            self.model = xgb.train(self.params, self.dtrain, num_boost_round=self.num_boost_round)
 
-            # Save trained model to disk
-            model_path = os.path.join(self.output_path, "model.pkl")
-            joblib.dump(self.model, model_path)
+            # Save trained model to disk (portable XGBoost JSON format)
+            model_path = os.path.join(self.output_path, "model.json")
+            self.model.save_model(model_path)
 
             # Log successful training
             logger.info("Model trained and saved successfully at %s", model_path)
@@ -155,6 +191,8 @@ class ModelTraining:
         """
         Evaluate the trained model on the test dataset using standard metrics.
 
+        The training-set accuracy is only computed when ``debug_eval`` is set.
+
         Metrics computed
         ----------------
         - Accuracy
@@ -168,18 +206,20 @@ class ModelTraining:
             If evaluation fails.
         """
         try:
-            # Compute training score directly from model
-            training_score = self.model.score(self.X_train, self.y_train)
-            logger.info("Training model score: %.4f", training_score)
+            # Training accuracy from the already-binned training matrix (opt-in)
+            if self.debug_eval:
+                y_train_pred = (self.model.predict(self.dtrain) > 0.5).astype(int)
+                training_score = accuracy_score(self.y_train, y_train_pred)
+                logger.info("Training model score: %.4f", training_score)
 
-            # Predict on test data
-            y_pred = self.model.predict(self.X_test)
+            # Predict on test data once (probabilities ➜ 0/1 labels) and reuse for all metrics
+            y_pred = (self.model.predict(xgb.DMatrix(self.X_test)) > 0.5).astype(int)
 
             # Compute evaluation metrics
             accuracy = accuracy_score(self.y_test, y_pred)
-            precision = precision_score(self.y_test, y_pred, average="weighted")
-            recall = recall_score(self.y_test, y_pred, average="weighted")
-            f1 = f1_score(self.y_test, y_pred, average="weighted")
+            precision, recall, f1, _ = precision_recall_fscore_support(
+                self.y_test, y_pred, average="weighted", zero_division=0
+            )
 
             # Log results
             logger.info(